@@ -114,9 +114,24 @@ class BrickBreaker(BaseAnimation):
         # - r = distance from center axis (how far from center)
         # - θ (theta) = angle around the tree (0° to 360°, like a clock)
         # - z = height (same as before)
-        self.radii = np.sqrt(self.x**2 + self.y**2)  # Distance from center axis
-        self.angles = np.arctan2(self.y, self.x)  # Angle around tree [-π, π]
-        self.angles_normalized = (self.angles + np.pi) / (2 * np.pi)  # Normalize to [0, 1] for easier math
+        # The per-LED arrays used every frame are kept as contiguous float32 -
+        # half the memory traffic of the default float64, and more than enough
+        # precision for LED positions on a tree
+        self.radii = np.sqrt(self.x**2 + self.y**2).astype(np.float32)  # Distance from center axis
+        self.angles = np.arctan2(self.y, self.x).astype(np.float32)  # Angle around tree [-π, π]
+        self.angles_normalized = ((self.angles + np.pi) / (2 * np.pi)).astype(np.float32)  # Normalize to [0, 1] for easier math
+
+        # Cache sin/cos of the (fixed) LED angles once. Per-frame relative
+        # angles to the paddle/ball/view direction can then be built from the
+        # angle-subtraction identities with just two scalar trig calls,
+        # instead of sweeping transcendentals over all 500 LEDs every frame.
+        self._sin_angles = np.sin(self.angles).astype(np.float32)
+        self._cos_angles = np.cos(self.angles).astype(np.float32)
+
+        # Preallocated per-LED scratch buffers, reused by the per-frame angle
+        # helpers so steady-state rendering allocates as little as possible
+        self._scratch_a = np.empty(len(POINTS_3D), dtype=np.float32)
+        self._scratch_b = np.empty(len(POINTS_3D), dtype=np.float32)
         
         # Height boundaries - find the actual min/max heights of LEDs
         self.z_min, self.z_max = self.z.min(), self.z.max()
@@ -124,8 +139,27 @@ class BrickBreaker(BaseAnimation):
         
         # Normalize z to [0, 1] so we can work with percentages
         # 0 = bottom of tree, 1 = top of tree
-        self.z_normalized = (self.z - self.z_min) / self.z_range
-        
+        self.z_normalized = ((self.z - self.z_min) / self.z_range).astype(np.float32)
+
+        # === Colors ===
+        # Classic brick breaker color scheme
+        # (Defined before the grid setup because the brick color tables are
+        # built from these base colors.)
+        self.bg_color = np.array([5, 5, 15])  # Dark blue-black background
+        self.paddle_color = np.array([255, 255, 255])  # White paddle
+        self.ball_color = np.array([255, 255, 0])  # Yellow ball
+
+        # Classic brick breaker colors - red and green alternating in checkerboard pattern
+        self.brick_red = np.array([255, 0, 0])  # Bright red
+        self.brick_green = np.array([0, 255, 0])  # Bright green
+        self.brick_dim_red = np.array([60, 0, 0])  # Dim red for back-face bricks (not visible)
+        self.brick_dim_green = np.array([0, 60, 0])  # Dim green for back-face bricks
+
+        # Pre-filled background frame in the buffer's own dtype - clearing
+        # the frame becomes one flat copy instead of a broadcast fill
+        self._bg_frame = np.empty_like(frameBuf)
+        self._bg_frame[:] = self.bg_color
+
         # === Grid System Setup ===
         # This creates the brick grid by assigning each LED to a section and band
         self._setup_grid()
@@ -135,6 +169,13 @@ class BrickBreaker(BaseAnimation):
         # It's like a window that shows ±72° (144° total) of the tree
         self.face_half_width = np.pi * 0.4  # ±72° visible = 144° total
         self.viewing_angle = 0.0  # Current center of visible face (starts at 0°)
+
+        # Cosine thresholds for angular "within X of" tests. An angle is
+        # within ±tol of a reference exactly when the cosine of the relative
+        # angle exceeds cos(tol), so per-LED tests become a single compare
+        # on the cosine - no arctan2 needed
+        self._cos_face_tol = np.cos(self.face_half_width)
+        self._cos_half_paddle_width = np.cos(paddle_width / 2)
         
         # Height boundaries for gameplay
         self.game_z_min = 0.1  # Paddle area (bottom 10% of tree)
@@ -147,6 +188,11 @@ class BrickBreaker(BaseAnimation):
         self.paddle_angle = 0.0  # Angular position (starts at center of visible face)
         self.paddle_z = 0.15  # Height position (15% up from bottom, normalized)
         self.paddle_thickness = 0.08  # How thick the paddle is in the Z direction
+
+        # The paddle only ever moves sideways, so which LEDs sit in its
+        # height band is fixed - precompute that mask once and leave only
+        # the angular test for the per-frame draw
+        self._paddle_row_mask = np.abs(self.z_normalized - self.paddle_z) < self.paddle_thickness
         
         # === Ball Setup ===
         # Ball position and velocity in cylindrical coordinates
@@ -156,29 +202,43 @@ class BrickBreaker(BaseAnimation):
         self.ball_v_z = ball_speed  # Vertical velocity (how fast it moves up/down)
         self.ball_radius_angle = 0.15  # Collision radius in radians (how "big" the ball is)
         self.ball_radius_z = 0.04  # Collision radius in z direction
-        
-        # === Colors ===
-        # Classic brick breaker color scheme
-        self.bg_color = np.array([5, 5, 15])  # Dark blue-black background
-        self.paddle_color = np.array([255, 255, 255])  # White paddle
-        self.ball_color = np.array([255, 255, 0])  # Yellow ball
-        
-        # Classic brick breaker colors - red and green alternating in checkerboard pattern
-        self.brick_red = np.array([255, 0, 0])  # Bright red
-        self.brick_green = np.array([0, 255, 0])  # Bright green
-        self.brick_dim_red = np.array([60, 0, 0])  # Dim red for back-face bricks (not visible)
-        self.brick_dim_green = np.array([0, 60, 0])  # Dim green for back-face bricks
-        
+
+        # Derived angular constants used by the per-frame movement and
+        # collision code, computed once instead of on every call
+        self._wall_limit = self.face_half_width - self.ball_radius_angle
+        self._max_paddle_offset = self.face_half_width - paddle_width / 2
+        self._brick_angle_threshold = self.section_width / 2 + self.ball_radius_angle
+        self._brick_z_threshold = self.band_height / 2 + self.ball_radius_z
+        
+        # === Win/Loss Animation Precomputation ===
+        # Per-LED terms of the celebration effects that never change from
+        # frame to frame, hoisted out of the render loops. The rainbow hue
+        # base is just angles_normalized (already stored above); the pulse
+        # phase offset depends only on each LED's height.
+        self._win_pulse_phase = self.z_normalized * 10
+        # Loss wash measures height from the top of the tree (0 = top)
+        self._z_from_top = 1.0 - self.z_normalized
+
         # === Game State ===
         # Track whether the game is won, lost, or playing
         self.won = False
         self.lost = False
+        self.active_brick_count = self.num_bricks  # Kept in sync as bricks are destroyed
         self.win_animation_frames = 0  # Counter for win animation
         self.loss_animation_frames = 0  # Counter for loss animation
         self.ball_fall_count = 0  # How many times the ball has fallen (lives system)
         self.brick_hit_cooldown = 0  # Prevent hitting multiple bricks in one frame
         self.frame_count = 0  # Total frames rendered
         self.game_count = 0  # How many games have been played
+
+        # Dispatch table: game state -> frame handler. renderNextFrame looks
+        # up the handler for the current state, so each path runs without
+        # checking for the other states' conditions
+        self._frame_handlers = {
+            'lost': self._render_loss_frame,
+            'won': self._render_win_frame,
+            'playing': self._render_gameplay_frame,
+        }
         
         # Print initialization info so we can see what was set up
         self._print_init_info()
@@ -226,47 +286,88 @@ class BrickBreaker(BaseAnimation):
             0, self.num_bands - 1
         )
         
-        # Create brick dictionary: (section, band) -> brick info
-        # This stores all the information about each brick
-        self.bricks = {}
+        # Create the bricks as parallel arrays (structure-of-arrays layout)
+        # instead of one dict per brick. Each brick gets one slot in every
+        # array below, so "brick b" is described by brick_sections[b],
+        # brick_center_angle[b], brick_active[b], etc. This keeps all the
+        # per-brick data contiguous in memory so the per-frame collision and
+        # rendering code can work on whole arrays at once.
+        brick_sections = []
+        brick_bands = []
+        brick_center_angles = []
+        brick_center_zs = []
+        brick_light_lists = []  # LED indices per brick (variable length)
         for section in range(self.num_sections):
             for band in range(self.num_bands):
                 # Find all LEDs that are in this specific cell (section AND band)
                 mask = (self.led_sections == section) & (self.led_bands == band)
-                indices = np.where(mask)[0].tolist()  # Get the LED indices
-                
+                indices = np.where(mask)[0]  # Get the LED indices
+
                 # Only create a brick if there are LEDs in this cell
                 if len(indices) > 0:
                     # Calculate the center of this brick in cylindrical coordinates
                     # This is used for collision detection - where is the brick "centered"?
                     brick_angles = self.angles[indices]
                     brick_z = self.z_normalized[indices]
-                    
+
                     # Handle angle wraparound for center calculation
                     # We use sin/cos average to handle the case where angles wrap around 0/360°
                     mean_sin = np.mean(np.sin(brick_angles))
                     mean_cos = np.mean(np.cos(brick_angles))
                     center_angle = np.arctan2(mean_sin, mean_cos)
                     center_z = np.mean(brick_z)  # Average height
-                    
-                    # Store all the brick information
-                    self.bricks[(section, band)] = {
-                        'indices': indices,  # Which LEDs make up this brick
-                        'active': True,  # Is this brick still in play? (False when hit)
-                        'section': section,  # Which angular section (0-7)
-                        'band': band,  # Which height band (0-7)
-                        'center_angle': center_angle,  # Center angle for collision
-                        'center_z': center_z,  # Center height for collision
-                        'num_leds': len(indices),  # How many LEDs in this brick
-                    }
-        
+
+                    brick_sections.append(section)
+                    brick_bands.append(band)
+                    brick_center_angles.append(center_angle)
+                    brick_center_zs.append(center_z)
+                    brick_light_lists.append(indices)
+
+        # Pack the per-brick columns into typed arrays
+        self.num_bricks = len(brick_sections)
+        self.brick_sections = np.array(brick_sections, dtype=np.int32)
+        self.brick_bands = np.array(brick_bands, dtype=np.int32)
+        self.brick_center_angle = np.array(brick_center_angles, dtype=np.float32)
+        self.brick_center_z = np.array(brick_center_zs, dtype=np.float32)
+        self.brick_active = np.ones(self.num_bricks, dtype=bool)  # False when hit
+
+        # Flatten the per-brick LED lists into one contiguous index array.
+        # Bricks have different LED counts, so we also keep start offsets:
+        # brick b owns brick_light_indices[starts[b]:starts[b+1]], and
+        # brick_light_owner maps each flat slot back to its brick id.
+        self.brick_light_counts = np.array([len(l) for l in brick_light_lists], dtype=np.int32)
+        self.brick_light_starts = np.concatenate(
+            ([0], np.cumsum(self.brick_light_counts))).astype(np.int32)
+        self.brick_light_indices = np.concatenate(brick_light_lists).astype(np.int32)
+        self.brick_light_owner = np.repeat(
+            np.arange(self.num_bricks, dtype=np.int32), self.brick_light_counts)
+
+        # Checkerboard color lookup tables, one RGB row per brick
+        # Even section+band = red, odd = green (same pattern as before)
+        is_red = ((self.brick_sections + self.brick_bands) % 2 == 0)[:, None]
+        self.brick_color_lut = np.where(is_red, self.brick_red, self.brick_green).astype(np.uint8)
+        self.brick_dim_color_lut = np.where(is_red, self.brick_dim_red, self.brick_dim_green).astype(np.uint8)
+
         # Store brick boundaries for collision detection
         self.section_width = section_width
         self.band_height = band_height
         self.band_z_min = band_z_min
-        
+
+        # Brick ids sorted by center height, plus the sorted heights
+        # themselves. The collision scan binary-searches this to bound the
+        # bricks whose height could overlap the ball before any angular math
+        self._brick_z_order = np.argsort(self.brick_center_z, kind='stable').astype(np.int32)
+        self._brick_z_sorted = self.brick_center_z[self._brick_z_order]
+
+        # Section center angles never move - cache them (and their sin/cos)
+        # so the per-frame visibility test is a couple of array multiplies
+        # rather than rebuilding the centers every call
+        self._section_centers = -np.pi + (np.arange(self.num_sections) + 0.5) * section_width
+        self._section_center_sin = np.sin(self._section_centers)
+        self._section_center_cos = np.cos(self._section_centers)
+
         # Print summary so we know what was created
-        print(f"Grid setup complete: {len(self.bricks)} bricks created")
+        print(f"Grid setup complete: {self.num_bricks} bricks created")
         print(f"  Sections: {self.num_sections} ({np.degrees(section_width):.1f}° each)")
         print(f"  Bands: {self.num_bands} ({band_height:.3f} z-units each)")
     
@@ -276,8 +377,8 @@ class BrickBreaker(BaseAnimation):
         print("BRICK BREAKER v2.1 - Red/Green Grid-Based")
         print(f"{'='*60}")
         print(f"Grid: {self.num_sections} sections × {self.num_bands} bands")
-        print(f"Total bricks: {len(self.bricks)}")
-        print(f"LEDs per brick: {np.mean([b['num_leds'] for b in self.bricks.values()]):.1f} avg")
+        print(f"Total bricks: {self.num_bricks}")
+        print(f"LEDs per brick: {self.brick_light_counts.mean():.1f} avg")
         print(f"Brick coverage: Upper 2/3 of tree (z >= 0.33)")
         print(f"Colors: Alternating RED and GREEN (checkerboard)")
         print(f"Visible face: ±{np.degrees(self.face_half_width):.0f}° ({np.degrees(2*self.face_half_width):.0f}° total)")
@@ -306,6 +407,54 @@ class BrickBreaker(BaseAnimation):
             diff += 2 * np.pi
         return diff
     
+    def _get_relative_angles(self, angle):
+        """
+        Signed angular distance from every LED to a reference angle, vectorized.
+
+        Uses the cached per-LED sin/cos with the angle-subtraction identities
+        (sin(a-b) = sin(a)cos(b) - cos(a)sin(b), etc.), so only two scalar
+        trig calls are needed no matter how many LEDs there are. The arctan2
+        at the end folds the result into the [-π, π] range, handling the
+        wraparound the same way _get_angular_distance does for scalars.
+
+        Args:
+            angle: Reference angle in radians
+
+        Returns:
+            Array of signed angular distances in radians, one per LED.
+            The result lives in a shared scratch buffer and is overwritten
+            by the next call to either angle helper - copy it if you need
+            to keep it around.
+        """
+        s, c = np.sin(angle), np.cos(angle)
+        sin_rel = np.multiply(self._sin_angles, c, out=self._scratch_a)
+        sin_rel -= self._cos_angles * s
+        cos_rel = np.multiply(self._cos_angles, c, out=self._scratch_b)
+        cos_rel += self._sin_angles * s
+        return np.arctan2(sin_rel, cos_rel, out=sin_rel)
+
+    def _get_cos_relative_angles(self, angle):
+        """
+        Cosine of the angular distance from every LED to a reference angle.
+
+        Enough for "is this LED within ±tol of the angle?" tests: the
+        condition |diff| < tol is the same as cos(diff) > cos(tol), which
+        avoids the arctan2 sweep of _get_relative_angles entirely. Compare
+        the result against a precomputed cosine threshold.
+
+        Args:
+            angle: Reference angle in radians
+
+        Returns:
+            Array of cos(angular distance), one per LED. Shares a scratch
+            buffer with _get_relative_angles, so the result is overwritten
+            by the next call to either helper.
+        """
+        s, c = np.sin(angle), np.cos(angle)
+        cos_rel = np.multiply(self._cos_angles, c, out=self._scratch_a)
+        cos_rel += self._sin_angles * s
+        return cos_rel
+
     def _is_angle_visible(self, angle):
         """
         Check if an angle is within the visible face.
@@ -331,16 +480,14 @@ class BrickBreaker(BaseAnimation):
         while still showing the 3D structure of the tree.
         
         Returns:
-            List of section numbers (0-7) that are currently visible
+            Array of section numbers (0-7) that are currently visible
         """
-        visible = []
-        for section in range(self.num_sections):
-            # Calculate the center angle of this section
-            # Sections are numbered 0-7, starting at -π and going around
-            section_center = -np.pi + (section + 0.5) * self.section_width
-            if self._is_angle_visible(section_center):
-                visible.append(section)
-        return visible
+        # A section is visible when the cosine of its center's offset from
+        # the viewing angle exceeds the face threshold (same dot-product
+        # test the LEDs use); the centers' sin/cos are cached in _setup_grid
+        cos_rel = (self._section_center_cos * np.cos(self.viewing_angle) +
+                   self._section_center_sin * np.sin(self.viewing_angle))
+        return np.flatnonzero(cos_rel > self._cos_face_tol)
     
     def _move_paddle(self):
         """
@@ -353,29 +500,22 @@ class BrickBreaker(BaseAnimation):
         # Calculate angular difference between paddle and ball
         # Positive = ball is to the right, negative = ball is to the left
         angle_diff = self._get_angular_distance(self.ball_angle, self.paddle_angle)
-        
-        # Move toward ball with some lag (dead zone prevents jittery movement)
-        if abs(angle_diff) > 0.05:  # Dead zone to prevent jitter
-            if angle_diff > 0:
-                self.paddle_angle += self.paddle_speed  # Move right
-            else:
-                self.paddle_angle -= self.paddle_speed  # Move left
-        
+
+        # Move toward ball with some lag, branchlessly: the sign picks the
+        # direction and the dead-zone comparison (0 or 1) suppresses jittery
+        # moves when the ball is nearly centered on the paddle
+        self.paddle_angle += self.paddle_speed * np.sign(angle_diff) * (abs(angle_diff) > 0.05)
+
         # Keep paddle within visible face
-        # Don't let it go off the edges where you can't see it
-        max_paddle_offset = self.face_half_width - self.paddle_width / 2
+        # Don't let it go off the edges where you can't see it - clamp the
+        # offset from the face center and rebuild the absolute angle
         paddle_diff = self._get_angular_distance(self.paddle_angle, self.viewing_angle)
-        if paddle_diff > max_paddle_offset:
-            self.paddle_angle = self.viewing_angle + max_paddle_offset
-        elif paddle_diff < -max_paddle_offset:
-            self.paddle_angle = self.viewing_angle - max_paddle_offset
-        
-        # Normalize paddle angle to [-π, π] range
-        # Keep it in the standard range for easier calculations
-        while self.paddle_angle > np.pi:
-            self.paddle_angle -= 2 * np.pi
-        while self.paddle_angle < -np.pi:
-            self.paddle_angle += 2 * np.pi
+        self.paddle_angle = self.viewing_angle + min(
+            max(paddle_diff, -self._max_paddle_offset), self._max_paddle_offset)
+
+        # Normalize paddle angle to [-π, π] range with modulo arithmetic
+        # instead of the while loops
+        self.paddle_angle = (self.paddle_angle + np.pi) % (2 * np.pi) - np.pi
     
     def _move_ball(self):
         """
@@ -405,8 +545,8 @@ class BrickBreaker(BaseAnimation):
         # === Side Wall Collisions (edge of visible face) ===
         # The ball bounces off the left and right edges of the visible face
         ball_to_center = self._get_angular_distance(self.ball_angle, self.viewing_angle)
-        wall_limit = self.face_half_width - self.ball_radius_angle  # Account for ball size
-        
+        wall_limit = self._wall_limit  # Accounts for ball size, precomputed
+
         if abs(ball_to_center) > wall_limit:
             # Ball hit the wall - reverse direction
             self.ball_v_angle = -self.ball_v_angle
@@ -445,33 +585,50 @@ class BrickBreaker(BaseAnimation):
             self.brick_hit_cooldown -= 1
         else:
             # Only check bricks in visible sections (can't hit back-face bricks)
+            # Test every brick at once with array comparisons instead of a
+            # Python loop over bricks - same math, one vectorized pass.
             visible_sections = self._get_visible_sections()
-            for (section, band), brick in self.bricks.items():
-                if not brick['active']:
-                    continue  # Skip destroyed bricks
-                if section not in visible_sections:
-                    continue  # Skip back-face bricks
-                
-                # Check collision with brick center
-                # Calculate distance from ball to brick center
-                angle_diff = abs(self._get_angular_distance(self.ball_angle, brick['center_angle']))
-                z_diff = abs(self.ball_z - brick['center_z'])
-                
-                # Collision thresholds - ball is within brick if both distances are small
-                angle_threshold = self.section_width / 2 + self.ball_radius_angle
-                z_threshold = self.band_height / 2 + self.ball_radius_z
-                
-                if angle_diff < angle_threshold and z_diff < z_threshold:
-                    # Ball hit brick! Destroy it and bounce
-                    brick['active'] = False
+            section_visible = np.zeros(self.num_sections, dtype=bool)
+            section_visible[visible_sections] = True
+
+            # Two binary searches on the height-sorted brick centers bound the
+            # bricks whose z could overlap the ball; whole bands above and
+            # below the ball drop out before any further filtering
+            lo = np.searchsorted(self._brick_z_sorted, self.ball_z - self._brick_z_threshold)
+            hi = np.searchsorted(self._brick_z_sorted, self.ball_z + self._brick_z_threshold, side='right')
+            in_window = self._brick_z_order[lo:hi]
+
+            # Narrow further to bricks that can actually be hit (still active
+            # and on the visible face) before doing any distance math; sorting
+            # restores the original brick order so the first-hit choice
+            # matches the unpruned scan
+            candidates = np.sort(in_window[
+                self.brick_active[in_window] & section_visible[self.brick_sections[in_window]]])
+            if candidates.size > 0:
+                # Angular and height distance from ball to the candidate centers
+                # (the modulo arithmetic handles the ±180° wraparound)
+                angle_diffs = np.abs(
+                    (self.ball_angle - self.brick_center_angle[candidates] + np.pi) % (2 * np.pi) - np.pi)
+                z_diffs = np.abs(self.ball_z - self.brick_center_z[candidates])
+
+                # Collision thresholds - ball is within brick if both distances
+                # are small (thresholds precomputed in __init__)
+                hit = ((angle_diffs < self._brick_angle_threshold) &
+                       (z_diffs < self._brick_z_threshold))
+                if hit.any():
+                    # Ball hit a brick! Destroy the first hit and bounce
+                    # (argmax picks the first True, matching the old loop order)
+                    k = int(np.argmax(hit))
+                    b = int(candidates[k])
+                    self.brick_active[b] = False
+                    self.active_brick_count -= 1
                     # Determine bounce direction based on which side was hit
                     # If hit top/bottom, bounce vertically; if hit side, bounce horizontally
-                    if z_diff > angle_diff * (self.band_height / self.section_width):
+                    if z_diffs[k] > angle_diffs[k] * (self.band_height / self.section_width):
                         self.ball_v_z = -self.ball_v_z  # Hit top or bottom
                     else:
                         self.ball_v_angle = -self.ball_v_angle  # Hit left or right side
                     self.brick_hit_cooldown = 5  # Prevent multiple hits
-                    break  # Only one brick per frame
         
         # === Ball Falls Below Paddle ===
         # Ball fell off the bottom - lives system
@@ -486,9 +643,9 @@ class BrickBreaker(BaseAnimation):
                 self._reset_ball()
         
         # === Win Condition ===
-        # Check if all bricks are destroyed
-        active_bricks = sum(1 for b in self.bricks.values() if b['active'])
-        if active_bricks == 0 and not self.won:
+        # Check if all bricks are destroyed - the counter is maintained on
+        # every hit, so no per-frame reduction over the brick arrays
+        if self.active_brick_count == 0 and not self.won:
             self.won = True
             self.win_animation_frames = 0
     
@@ -513,8 +670,8 @@ class BrickBreaker(BaseAnimation):
         moves to a new face of the tree, and starts a new game.
         """
         # Reset all bricks to active
-        for brick in self.bricks.values():
-            brick['active'] = True
+        self.brick_active[:] = True
+        self.active_brick_count = self.num_bricks
         
         # Rotate to a new face for variety
         self.game_count += 1
@@ -533,99 +690,102 @@ class BrickBreaker(BaseAnimation):
     def renderNextFrame(self) -> None:
         """
         Render one frame of the game.
-        
+
         This is called every frame by the animation framework. It:
         1. Updates the viewing angle (slow rotation)
-        2. Handles win/loss animations
-        3. Updates game state (move paddle, move ball)
-        4. Renders everything to frameBuf (bricks, paddle, ball)
+        2. Dispatches to the handler for the current state (lost, won, or
+           playing) via the dispatch table built in __init__
         """
         self.frame_count += 1
-        
+
         # Slow rotation of the viewing angle
         # This makes the game slowly rotate around the tree, showing different faces
         self.viewing_angle += self.rotation_speed
         if self.viewing_angle > np.pi:
             self.viewing_angle -= 2 * np.pi
-        
-        # Handle win/loss animations
-        if self.lost:
-            self.loss_animation_frames += 1
-            if self.loss_animation_frames >= 120:  # 4 seconds at 30fps
-                # Animation complete, reset game
-                self._reset_game()
-            else:
-                # Show loss effect (white wash)
-                self._render_loss_effect()
-                return
-        
-        if self.won:
-            self.win_animation_frames += 1
-            if self.win_animation_frames >= 90:  # 3 seconds at 30fps
-                # Animation complete, reset game
-                self._reset_game()
-            else:
-                # Show win celebration (rainbow)
-                self._render_win_celebration()
-                return
-        
-        # Update game state (move paddle, move ball, check collisions)
+
+        state = 'lost' if self.lost else 'won' if self.won else 'playing'
+        self._frame_handlers[state]()
+
+    def _render_loss_frame(self):
+        """Advance the loss animation, resetting the game when it finishes."""
+        self.loss_animation_frames += 1
+        if self.loss_animation_frames >= 120:  # 4 seconds at 30fps
+            # Animation complete, reset and render a normal gameplay frame
+            self._reset_game()
+            self._render_gameplay_frame()
+        else:
+            # Show loss effect (white wash)
+            self._render_loss_effect()
+
+    def _render_win_frame(self):
+        """Advance the win animation, resetting the game when it finishes."""
+        self.win_animation_frames += 1
+        if self.win_animation_frames >= 90:  # 3 seconds at 30fps
+            # Animation complete, reset and render a normal gameplay frame
+            self._reset_game()
+            self._render_gameplay_frame()
+        else:
+            # Show win celebration (rainbow)
+            self._render_win_celebration()
+
+    def _render_gameplay_frame(self):
+        """
+        Run one frame of normal gameplay.
+
+        Updates game state (move paddle, move ball, check collisions) and
+        renders everything to frameBuf (bricks, paddle, ball).
+        """
         self._move_paddle()
         self._move_ball()
-        
+
         # === Render Frame ===
-        # Clear to background color
-        self.frameBuf[:] = self.bg_color
+        # Clear to background color (straight copy of the pre-filled frame)
+        np.copyto(self.frameBuf, self._bg_frame)
         
         # Get which sections are currently visible
         visible_sections = self._get_visible_sections()
         
         # Draw bricks - alternating red and green in checkerboard pattern
-        for (section, band), brick in self.bricks.items():
-            if not brick['active']:
-                continue  # Skip destroyed bricks
-            
-            # Checkerboard pattern: alternate based on section + band
-            # Even sum = red, odd sum = green
-            is_red = (section + band) % 2 == 0
-            
-            if section in visible_sections:
-                # Full brightness for visible bricks
-                color = self.brick_red if is_red else self.brick_green
-            else:
-                # Dim color for back-face bricks (so you can see tree structure)
-                color = self.brick_dim_red if is_red else self.brick_dim_green
-            
-            # Set color for all LEDs in this brick
-            for idx in brick['indices']:
-                self.frameBuf[idx] = color
-        
+        # All brick LEDs are written with one fancy-indexed store instead of
+        # looping over bricks and their LEDs in Python.
+        section_visible = np.zeros(self.num_sections, dtype=bool)
+        section_visible[visible_sections] = True
+
+        # Pick full-brightness or dim colors per brick depending on whether
+        # its section faces the viewer, then expand to one color per LED
+        # via the owner array (brick id of each flat LED slot)
+        brick_colors = np.where(section_visible[self.brick_sections][:, None],
+                                self.brick_color_lut, self.brick_dim_color_lut)
+        lit = self.brick_active[self.brick_light_owner]  # LEDs of surviving bricks
+        self.frameBuf[self.brick_light_indices[lit]] = brick_colors[self.brick_light_owner[lit]]
+        
+        # Which LEDs are on the visible face (needed by paddle and ball) -
+        # dot-product sign test against the precomputed cosine threshold,
+        # no trig over the LED arrays at all
+        visible = self._get_cos_relative_angles(self.viewing_angle) > self._cos_face_tol
+
         # Draw paddle
-        # Find all LEDs that are near the paddle position
-        for i in range(len(POINTS_3D)):
-            angle_diff = abs(self._get_angular_distance(self.angles[i], self.paddle_angle))
-            z_diff = abs(self.z_normalized[i] - self.paddle_z)
-            
-            # Check if this LED is within paddle bounds
-            if angle_diff < self.paddle_width / 2 and z_diff < self.paddle_thickness:
-                # Only draw if it's on the visible face
-                if self._is_angle_visible(self.angles[i]):
-                    self.frameBuf[i] = self.paddle_color
-        
+        # The paddle's height band is fixed (mask precomputed in __init__),
+        # so only the angular test runs per frame
+        on_paddle = ((self._get_cos_relative_angles(self.paddle_angle) > self._cos_half_paddle_width) &
+                     self._paddle_row_mask &
+                     visible)
+        self.frameBuf[on_paddle] = self.paddle_color
+
         # Draw ball
-        # Find all LEDs that are near the ball position
-        for i in range(len(POINTS_3D)):
-            angle_diff = abs(self._get_angular_distance(self.angles[i], self.ball_angle))
-            z_diff = abs(self.z_normalized[i] - self.ball_z)
-            
-            # Calculate distance in normalized space (ellipse shape)
-            # Ball is slightly wider in angle than in height
-            dist = np.sqrt((angle_diff / self.ball_radius_angle)**2 + 
-                          (z_diff / self.ball_radius_z)**2)
-            
-            # If within ball radius and visible, draw ball
-            if dist < 1.0 and self._is_angle_visible(self.angles[i]):
-                self.frameBuf[i] = self.ball_color
+        # Find all LEDs that are near the ball position, in one array pass
+        ball_diffs = np.abs(self._get_relative_angles(self.ball_angle))
+        ball_z_diffs = np.abs(self.z_normalized - self.ball_z)
+
+        # Calculate squared distance in normalized space (ellipse shape)
+        # Ball is slightly wider in angle than in height. Comparing the
+        # squared sum against 1 gives the same footprint without the sqrt
+        dist_sq = ((ball_diffs / self.ball_radius_angle)**2 +
+                   (ball_z_diffs / self.ball_radius_z)**2)
+
+        # If within ball radius and visible, draw ball
+        self.frameBuf[(dist_sq < 1.0) & visible] = self.ball_color
     
     def _render_win_celebration(self):
         """
@@ -636,36 +796,24 @@ class BrickBreaker(BaseAnimation):
         around the tree plus a time-based rotation.
         """
         progress = self.win_animation_frames / 90.0  # 0 to 1 over 3 seconds
-        
-        # Create expanding rainbow rings
-        for i in range(len(POINTS_3D)):
-            # Hue based on angle around tree + time
-            # This creates a rotating rainbow effect
-            hue = (self.angles_normalized[i] + progress * 0.5) % 1.0
-            
-            # Brightness pulse - makes it feel alive
-            pulse = 0.7 + 0.3 * np.sin(self.win_animation_frames * 0.1 + self.z_normalized[i] * 10)
-            
-            # Convert HSV to RGB manually (for speed)
-            h = hue * 6
-            c = 1.0
-            x = c * (1 - abs(h % 2 - 1))
-            
-            if h < 1:
-                r, g, b = c, x, 0
-            elif h < 2:
-                r, g, b = x, c, 0
-            elif h < 3:
-                r, g, b = 0, c, x
-            elif h < 4:
-                r, g, b = 0, x, c
-            elif h < 5:
-                r, g, b = x, 0, c
-            else:
-                r, g, b = c, 0, x
-            
-            # Apply pulse and convert to RGB
-            self.frameBuf[i] = [int(r * 255 * pulse), int(g * 255 * pulse), int(b * 255 * pulse)]
+
+        # Hue based on angle around tree + time
+        # This creates a rotating rainbow effect
+        hue = (self.angles_normalized + progress * 0.5) % 1.0
+
+        # Brightness pulse - makes it feel alive (phase precomputed in __init__)
+        pulse = 0.7 + 0.3 * np.sin(self.win_animation_frames * 0.1 + self._win_pulse_phase)
+
+        # Inline branchless HSV→RGB for full saturation and value: each
+        # channel is a clipped triangle wave of the hue, so the conversion is
+        # a handful of arithmetic ops per channel - no piecewise segment
+        # selection or (N, 3) HSV intermediate - and each channel is scaled
+        # by the pulse and cast straight into its frameBuf column
+        h6 = hue * 6.0
+        scale = pulse * 255.0
+        self.frameBuf[:, 0] = (np.clip(np.abs(h6 - 3.0) - 1.0, 0.0, 1.0) * scale).astype(np.uint8)
+        self.frameBuf[:, 1] = (np.clip(2.0 - np.abs(h6 - 2.0), 0.0, 1.0) * scale).astype(np.uint8)
+        self.frameBuf[:, 2] = (np.clip(2.0 - np.abs(h6 - 4.0), 0.0, 1.0) * scale).astype(np.uint8)
     
     def _render_loss_effect(self):
         """
@@ -675,19 +823,14 @@ class BrickBreaker(BaseAnimation):
         to bottom, like a "game over" effect.
         """
         progress = self.loss_animation_frames / 120.0  # 0 to 1 over 4 seconds
-        
-        for i in range(len(POINTS_3D)):
-            # Calculate position from top (0 = top, 1 = bottom)
-            z_from_top = 1.0 - self.z_normalized[i]
-            
-            # Wash position moves from top to bottom
-            wash_position = progress * 1.15  # Slightly extend past bottom
-            
-            # Distance from wash edge
-            distance_from_wash = wash_position - z_from_top
-            
-            # Brightness: 1.0 if above wash, fade to 0.0 in transition band
-            brightness = np.clip(1.0 - (distance_from_wash / 0.15), 0.0, 1.0)
-            
-            # White color with calculated brightness
-            self.frameBuf[i] = [int(255 * brightness)] * 3
+
+        # Wash position moves from top to bottom (slightly past the bottom)
+        wash_position = progress * 1.15
+
+        # Brightness: 1.0 if above wash, fade to 0.0 in transition band
+        # (position from top is precomputed in __init__)
+        brightness = np.clip(1.0 - (wash_position - self._z_from_top) / 0.15, 0.0, 1.0)
+
+        # Scale to 0-255 and cast once on the 1-D array, then broadcast the
+        # single white channel across R, G and B - no (N, 3) float temporary
+        self.frameBuf[:] = (brightness * 255.0).astype(np.uint8)[:, None]